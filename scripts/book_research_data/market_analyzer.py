@@ -2,20 +2,187 @@
 
 import requests
 import json
+import os
 import sys
 import time
+import math
+import hashlib
+import tempfile
 import re
 import csv
+import sqlite3
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus, urlencode
-from bs4 import BeautifulSoup
-import random
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # C parser, much faster than html.parser
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
-import statistics
+
+SEARCH_PAGES = 5
+RESULTS_PER_PAGE = 16  # organic results on an Amazon books search page
+DETAIL_WORKERS = 6
+REQUEST_TIMEOUT = (5, 15)  # (connect, read) seconds
+
+# Only build the parts of each page we read; the rest of the markup is skipped
+SEARCH_STRAINER = SoupStrainer('div', attrs={'data-component-type': 's-search-result'})
+DETAIL_STRAINER = SoupStrainer(id=['bookDescription_feature_div', 'detailBulletsWrapper_feature_div',
+                                   'detailBullets_feature_div', 'prodDetails'])
+
+# Patterns used by the per-result extraction helpers
+_NUMBER_RE = re.compile(r'\d+')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_PRICE_RE = re.compile(r'\$?(\d+\.?\d*)')
+_COMMA_TABLE = str.maketrans('', '', ',')
+
+# Detail-page labels and the values parsed out of them
+_BSR_LABEL_RE = re.compile(r'Best Sellers Rank|Amazon Best Sellers Rank')
+_PAGES_LABEL_RE = re.compile(r'Print length|File Size')
+_PUB_DATE_LABEL_RE = re.compile(r'Publication date')
+_DETAIL_LABELS = (('bsr', _BSR_LABEL_RE), ('pages', _PAGES_LABEL_RE),
+                  ('publication_date', _PUB_DATE_LABEL_RE))
+_BSR_RE = re.compile(r'#([\d,]+)')
+_CATEGORY_RE = re.compile(r'in\s+([^(]+)(?:\s+\([^)]+\))?')
+_INT_RE = re.compile(r'(\d+)')
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Title tokenization for keyword suggestions. For ASCII titles the translate
+# table lowercases letters, keeps digits/underscores (word characters that
+# disqualify a token) and turns everything else into a separator, which
+# yields the same words as _TITLE_WORD_RE without running the regex engine
+_TITLE_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_TITLE_TABLE = str.maketrans({c: c.lower() if c.isalnum() or c == '_' else ' '
+                              for c in map(chr, range(128))})
+_STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'your', 'how', 'guide', 'book', 'complete', 'ultimate'})
+
+# Upper bounds of the price-distribution buckets reported by analyze_pricing
+PRICE_EDGES = (3, 6, 10)
+PRICE_BANDS = ('under_3', '3_to_6', '6_to_10', 'over_10')
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
+
+def _mean(values):
+    """Arithmetic mean, or 0 for an empty list"""
+    return math.fsum(values) / len(values) if values else 0
+
+def _sorted_median(values):
+    """Median of an already sorted, non-empty list"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+# Books from every search, keyed by (query, ASIN), so repeat searches
+# upsert rows instead of rewriting one growing JSON file
+BOOK_STORE = 'market.db'
+
+def open_book_store(path=BOOK_STORE):
+    """Open the SQLite book store, creating the table on first use"""
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE IF NOT EXISTS books ('
+                'query TEXT, asin TEXT, payload TEXT, updated_at TEXT, '
+                'PRIMARY KEY (query, asin))')
+    return con
+
+def save_books(con, books, query):
+    """Upsert books found for query; books without an ASIN cannot be keyed and are skipped"""
+    rows = [(query, b['asin'], dump_json(b, indent=False).decode('utf-8'), b.get('extracted_at'))
+            for b in books if b.get('asin', 'Unknown') != 'Unknown']
+    with con:
+        con.executemany('INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?)', rows)
+
+def load_books(con, query):
+    """Return every stored book for query, most recently saved last"""
+    cursor = con.execute('SELECT payload FROM books WHERE query = ? ORDER BY rowid', (query,))
+    return [load_json(payload) for (payload,) in cursor]
+
+# On-disk cache shared across runs; lives next to the scripts so the
+# research suite's 'clean' command clears it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+SEARCH_CACHE_TTL = 6 * 3600
+DETAIL_CACHE_TTL = 7 * 24 * 3600
+
+def cache_get(key, ttl):
+    """Return the cached value for key, or None if missing or older than ttl seconds"""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as f:
+                return load_json(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def cache_set(key, value):
+    """Atomically store value under key; cache failures never abort the analysis"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            f.write(dump_json(value, indent=False))
+        os.replace(f.name, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError as e:
+        print(f"Cache write failed for {key}: {e}")
+
+class RateLimiter:
+    """Thread-safe token bucket allowing max_calls requests per period"""
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self.tokens = max_calls
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                refill = (now - self.updated) * self.max_calls / self.period
+                self.tokens = min(self.max_calls, self.tokens + refill)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) * self.period / self.max_calls
+            time.sleep(delay)
 
 class MarketResearcher:
     def __init__(self, config=None):
         self.session = requests.Session()
+        # Keep-alive pool sized above the worker count, retrying throttling and
+        # transient server errors with backoff
+        retry = Retry(total=3, backoff_factor=0.4,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET']))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -24,41 +191,84 @@ class MarketResearcher:
         self.session.headers.update(self.headers)
         self.config = config or {}
         self.rate_limit_delay = 2
+        # Pages are fetched concurrently, so politeness comes from a shared
+        # token bucket rather than a sleep between sequential requests
+        self.rate_limiter = RateLimiter(max_calls=3, period=self.rate_limit_delay)
 
     def search_amazon_comprehensive(self, query, max_results=50):
         """Comprehensive Amazon search with detailed metrics"""
         print(f"🔍 Searching Amazon for: '{query}'")
         
-        books = []
-        page = 1
+        urls = [f"https://www.amazon.com/s?k={quote_plus(query)}&i=stripbooks&page={page}"
+                for page in range(1, SEARCH_PAGES + 1)]
         
-        while len(books) < max_results and page <= 5:
-            url = f"https://www.amazon.com/s?k={quote_plus(query)}&i=stripbooks&page={page}"
+        books = []
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=SEARCH_PAGES) as executor:
+            futures = []
             
-            try:
-                time.sleep(self.rate_limit_delay)
-                response = self.session.get(url, timeout=15, verify=False)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                results = soup.find_all('div', {'data-component-type': 's-search-result'})
-                
-                if not results:
+            def request_pages(still_needed):
+                # Queue only as many further pages as the shortfall calls for
+                wanted = min(SEARCH_PAGES, len(futures) + math.ceil(still_needed / RESULTS_PER_PAGE))
+                for url in urls[len(futures):wanted]:
+                    futures.append(executor.submit(self.fetch_search_page, url, query, stop))
+            
+            request_pages(max_results)
+            
+            # Merge in page order, stopping at the first empty or failed page
+            page = 0
+            while page < len(futures):
+                future = futures[page]
+                page += 1
+                try:
+                    page_books = future.result()
+                except Exception as e:
+                    print(f"Error on page {page}: {e}")
                     break
                 
-                for result in results:
-                    if len(books) >= max_results:
-                        break
-                    
-                    book = self.extract_comprehensive_book_data(result, query)
-                    if book:
-                        books.append(book)
+                if not page_books:
+                    break
                 
-                page += 1
+                books.extend(page_books[:max_results - len(books)])
+                if len(books) >= max_results:
+                    break
                 
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                break
+                # Every queued page is merged and still short; queue more
+                if page == len(futures):
+                    request_pages(max_results - len(books))
+            
+            # Pages still waiting on the rate limiter are no longer needed
+            stop.set()
+        
+        return books
+
+    def fetch_search_page(self, url, query, stop):
+        """Fetch and extract one search results page (runs in a worker thread)"""
+        cache_key = 'amazon_search_' + hashlib.sha1(url.encode()).hexdigest()
+        cached = cache_get(cache_key, SEARCH_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        self.rate_limiter.wait()
+        if stop.is_set():
+            return []
+        with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            # Parse from the raw stream so the body is not also cached on response.content
+            response.raw.decode_content = True
+            soup = BeautifulSoup(response.raw, PARSER, parse_only=SEARCH_STRAINER)
+        
+        results = soup.find_all('div', {'data-component-type': 's-search-result'}, recursive=False)
+        
+        books = []
+        for result in results:
+            book = self.extract_comprehensive_book_data(result, query)
+            if book:
+                books.append(book)
+        
+        # Empty pages may be a captcha or the end of results; only cache hits
+        if books:
+            cache_set(cache_key, books)
         
         return books
 
@@ -120,39 +330,46 @@ class MarketResearcher:
         """Get detailed metrics for specific book"""
         if asin == 'Unknown':
             return {}
+        
+        cache_key = f"amazon_detail_{asin}"
+        cached = cache_get(cache_key, DETAIL_CACHE_TTL)
+        if cached is not None:
+            return cached
             
         url = f"https://www.amazon.com/dp/{asin}"
         
         try:
-            time.sleep(random.uniform(2, 4))
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self.rate_limiter.wait()
+            with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                soup = BeautifulSoup(response.raw, PARSER, parse_only=DETAIL_STRAINER)
             
             details = {}
+            labels = self.find_detail_labels(soup)
             
             # Best Seller Rank
-            bsr_elem = soup.find('span', string=re.compile(r'Best Sellers Rank|Amazon Best Sellers Rank'))
+            bsr_elem = labels.get('bsr')
             if bsr_elem:
                 bsr_parent = bsr_elem.find_parent()
                 if bsr_parent:
                     bsr_text = bsr_parent.get_text()
-                    bsr_match = re.search(r'#([\d,]+)', bsr_text)
+                    bsr_match = _BSR_RE.search(bsr_text)
                     details['bsr'] = int(bsr_match.group(1).replace(',', '')) if bsr_match else None
                     
                     # Extract categories
-                    categories = re.findall(r'in\s+([^(]+)(?:\s+\([^)]+\))?', bsr_text)
+                    categories = _CATEGORY_RE.findall(bsr_text)
                     details['categories'] = [cat.strip() for cat in categories[:3]]
 
             # Page count
-            pages_elem = soup.find('span', string=re.compile(r'Print length|File Size'))
+            pages_elem = labels.get('pages')
             if pages_elem:
                 pages_text = pages_elem.find_next().get_text()
-                pages_match = re.search(r'(\d+)', pages_text)
+                pages_match = _INT_RE.search(pages_text)
                 details['pages'] = int(pages_match.group(1)) if pages_match else None
 
             # Publication date
-            pub_elem = soup.find('span', string=re.compile(r'Publication date'))
+            pub_elem = labels.get('publication_date')
             if pub_elem:
                 details['publication_date'] = pub_elem.find_next().get_text().strip()
 
@@ -163,12 +380,28 @@ class MarketResearcher:
                 details['description_length'] = len(desc_text.strip())
                 details['description_quality'] = self.analyze_description_quality(desc_text)
 
+            if details:
+                cache_set(cache_key, details)
             return details
 
         except Exception as e:
             print(f"Error getting detailed metrics for {asin}: {e}")
             return {}
 
+    def find_detail_labels(self, soup):
+        """Locate the detail-bullet label spans in a single walk over the page"""
+        labels = {}
+        for span in soup.find_all('span'):
+            text = span.string
+            if text is None:
+                continue
+            for key, pattern in _DETAIL_LABELS:
+                if key not in labels and pattern.search(text):
+                    labels[key] = span
+            if len(labels) == len(_DETAIL_LABELS):
+                break
+        return labels
+
     def analyze_market_opportunity(self, books, query):
         """Comprehensive market opportunity analysis"""
         if not books:
@@ -202,45 +435,60 @@ class MarketResearcher:
 
     def analyze_competition(self, books):
         """Analyze competitive landscape"""
-        valid_books = [b for b in books if b.get('reviews_count', 0) > 0]
-        
-        if not valid_books:
+        # Transpose the reviewed books into per-field columns in one pass
+        reviews = []
+        ratings = []
+        authors = []
+        for b in books:
+            reviews_count = b.get('reviews_count', 0)
+            if reviews_count <= 0:
+                continue
+            reviews.append(reviews_count)
+            if b.get('rating', 0) > 0:
+                ratings.append(b['rating'])
+            authors.append(b.get('author', 'Unknown'))
+        
+        if not reviews:
             return {'error': 'No valid books for analysis'}
 
-        reviews = [b['reviews_count'] for b in valid_books]
-        ratings = [b['rating'] for b in valid_books if b.get('rating', 0) > 0]
+        # Sort once; min, max and median all come from the sorted list
+        reviews.sort()
         
         # Author diversity
-        authors = [b.get('author', 'Unknown') for b in valid_books]
         author_counts = Counter(authors)
         
         return {
-            'total_competitors': len(valid_books),
-            'avg_reviews': statistics.mean(reviews),
-            'median_reviews': statistics.median(reviews),
-            'max_reviews': max(reviews),
-            'min_reviews': min(reviews),
-            'avg_rating': statistics.mean(ratings) if ratings else 0,
-            'author_diversity': len(set(authors)),
+            'total_competitors': len(reviews),
+            'avg_reviews': _mean(reviews),
+            'median_reviews': _sorted_median(reviews),
+            'max_reviews': reviews[-1],
+            'min_reviews': reviews[0],
+            'avg_rating': _mean(ratings),
+            'author_diversity': len(author_counts),
             'dominant_authors': dict(author_counts.most_common(5)),
             'competition_level': self.assess_competition_level(reviews, ratings)
         }
 
     def analyze_demand(self, books, query):
         """Analyze market demand indicators"""
-        total_reviews = sum(b.get('reviews_count', 0) for b in books)
+        # Total reviews and recent activity (books with reviews in estimated
+        # recent period) gathered in one pass
+        total_reviews = 0
+        active_books = 0
+        for b in books:
+            reviews_count = b.get('reviews_count', 0)
+            total_reviews += reviews_count
+            if reviews_count > 50:
+                active_books += 1
         
         # Estimate search volume from results
         result_density = len(books)
         
-        # Recent activity (books with reviews in estimated recent period)
-        recent_books = [b for b in books if b.get('reviews_count', 0) > 50]
-        
         return {
             'total_market_reviews': total_reviews,
             'avg_reviews_per_book': total_reviews / len(books) if books else 0,
             'result_density': result_density,
-            'active_books': len(recent_books),
+            'active_books': active_books,
             'market_activity_level': self.assess_market_activity(total_reviews, len(books)),
             'estimated_monthly_searches': self.estimate_search_volume(query, result_density)
         }
@@ -249,16 +497,16 @@ class MarketResearcher:
         """Identify quality opportunities"""
         gaps = {}
         
-        # Rating gaps
-        low_rated = [b for b in books if b.get('rating', 5) < 4.0 and b.get('reviews_count', 0) > 20]
-        gaps['low_rated_opportunities'] = len(low_rated)
-        
-        # Format gaps
-        title_words = []
+        # Rating gaps and title word frequencies (for format gaps) in one pass
+        low_rated = 0
+        word_freq = Counter()
         for book in books:
-            title_words.extend(book.get('title', '').lower().split())
+            if book.get('rating', 5) < 4.0 and book.get('reviews_count', 0) > 20:
+                low_rated += 1
+            word_freq.update(book.get('title', '').lower().split())
+        gaps['low_rated_opportunities'] = low_rated
         
-        word_freq = Counter(title_words)
+        # Format gaps
         common_formats = ['guide', 'handbook', 'workbook', 'journal', 'planner']
         missing_formats = [fmt for fmt in common_formats if fmt not in word_freq]
         
@@ -269,21 +517,20 @@ class MarketResearcher:
 
     def analyze_pricing(self, books):
         """Analyze pricing opportunities"""
-        prices = [b.get('price', 0) for b in books if b.get('price', 0) > 0]
+        prices = sorted(b.get('price', 0) for b in books if b.get('price', 0) > 0)
         
         if not prices:
             return {'error': 'No pricing data available'}
 
-        price_ranges = {
-            'under_3': len([p for p in prices if p < 3]),
-            '3_to_6': len([p for p in prices if 3 <= p < 6]),
-            '6_to_10': len([p for p in prices if 6 <= p < 10]),
-            'over_10': len([p for p in prices if p >= 10])
-        }
+        # Bucket every price in a single pass
+        counts = [0] * len(PRICE_BANDS)
+        for p in prices:
+            counts[bisect_right(PRICE_EDGES, p)] += 1
+        price_ranges = dict(zip(PRICE_BANDS, counts))
 
         return {
-            'avg_price': statistics.mean(prices),
-            'median_price': statistics.median(prices),
+            'avg_price': _mean(prices),
+            'median_price': _sorted_median(prices),
             'price_range_distribution': price_ranges,
             'optimal_price_gap': self.find_price_gaps(prices),
             'pricing_strategy': self.suggest_pricing_strategy(prices)
@@ -299,7 +546,7 @@ class MarketResearcher:
             pub_date = book.get('publication_date', '')
             if pub_date:
                 # Simple year extraction
-                year_match = re.search(r'20\d{2}', str(pub_date))
+                year_match = _YEAR_RE.search(str(pub_date))
                 if year_match:
                     year = int(year_match.group())
                     if year >= current_year - 2:
@@ -354,21 +601,21 @@ class MarketResearcher:
 
     # Helper methods
     def extract_number(self, text):
-        numbers = re.findall(r'[\d,]+', text.replace(',', ''))
-        return int(numbers[0]) if numbers else 0
+        number_match = _NUMBER_RE.search(text.translate(_COMMA_TABLE))
+        return int(number_match.group()) if number_match else 0
 
     def extract_rating(self, text):
-        rating_match = re.search(r'(\d+\.?\d*)', text)
+        rating_match = _RATING_RE.search(text)
         return float(rating_match.group(1)) if rating_match else 0.0
 
     def extract_price(self, text):
-        price_match = re.search(r'\$?(\d+\.?\d*)', text.replace(',', ''))
+        price_match = _PRICE_RE.search(text.translate(_COMMA_TABLE))
         return float(price_match.group(1)) if price_match else 0.0
 
     def estimate_publication_date(self, result_div):
         # Try to find publication indicators in the result
         date_text = result_div.get_text()
-        year_matches = re.findall(r'20\d{2}', date_text)
+        year_matches = _YEAR_RE.findall(date_text)
         return year_matches[-1] if year_matches else 'Unknown'
 
     def analyze_description_quality(self, text):
@@ -381,8 +628,8 @@ class MarketResearcher:
             return 'good'
 
     def assess_competition_level(self, reviews, ratings):
-        avg_reviews = statistics.mean(reviews) if reviews else 0
-        avg_rating = statistics.mean(ratings) if ratings else 0
+        avg_reviews = _mean(reviews)
+        avg_rating = _mean(ratings)
         
         if avg_reviews > 500 and avg_rating > 4.3:
             return 'high'
@@ -415,22 +662,18 @@ class MarketResearcher:
         return base_estimate
 
     def find_price_gaps(self, prices):
-        sorted_prices = sorted(prices)
-        gaps = []
+        if len(prices) < 2:
+            return []
         
-        for i in range(len(sorted_prices) - 1):
-            gap = sorted_prices[i + 1] - sorted_prices[i]
-            if gap > 1.0:  # Significant price gap
-                gaps.append({
-                    'gap_start': sorted_prices[i],
-                    'gap_end': sorted_prices[i + 1],
-                    'gap_size': gap
-                })
+        sorted_prices = sorted(prices)
         
-        return gaps
+        # Walk adjacent pairs; a gap over $1 is significant
+        return [{'gap_start': low, 'gap_end': high, 'gap_size': high - low}
+                for low, high in zip(sorted_prices, sorted_prices[1:])
+                if high - low > 1.0]
 
     def suggest_pricing_strategy(self, prices):
-        median_price = statistics.median(prices)
+        median_price = _sorted_median(sorted(prices))
         
         if median_price < 3:
             return 'premium_opportunity'
@@ -444,24 +687,26 @@ def analyze_social_trends(query):
     """Analyze social media trends (simplified version)"""
     # This would need API access for real implementation
     # For now, provide structure for manual research
+    tag = query.replace(' ', '')
     return {
-        'instagram_research': f"Search hashtag #{query.replace(' ', '')}",
-        'tiktok_research': f"Check TikTok for #{query.replace(' ', '')}",
+        'instagram_research': f"Search hashtag #{tag}",
+        'tiktok_research': f"Check TikTok for #{tag}",
         'youtube_research': f"Search YouTube for '{query} tutorial'",
-        'reddit_research': f"Search Reddit for r/{query.replace(' ', '')}"
+        'reddit_research': f"Search Reddit for r/{tag}"
     }
 
 def generate_keyword_suggestions(successful_titles):
     """Generate keyword suggestions from successful titles"""
-    all_words = []
+    word_freq = Counter()
     
     for title in successful_titles:
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
+        if title.isascii():
+            words = (w for w in title.translate(_TITLE_TABLE).split() if len(w) >= 3 and w.isalpha())
+        else:
+            words = _TITLE_WORD_RE.findall(title.lower())
         # Filter out common words
-        filtered_words = [w for w in words if w not in ['the', 'and', 'for', 'with', 'your', 'how', 'guide', 'book', 'complete', 'ultimate']]
-        all_words.extend(filtered_words)
+        word_freq.update(w for w in words if w not in _STOP_WORDS)
     
-    word_freq = Counter(all_words)
     return word_freq.most_common(20)
 
 if __name__ == "__main__":
@@ -481,35 +726,54 @@ if __name__ == "__main__":
         
         # Get detailed metrics for top books
         print(f"📊 Getting detailed metrics for {len(books)} books...")
-        for book in books[:20]:  # Limit detailed analysis to prevent rate limiting
-            details = researcher.get_detailed_book_metrics(book.get('asin', ''))
-            book.update(details)
+        # Limit detailed analysis to prevent rate limiting
+        top_books = [b for b in books[:20] if b.get('asin') != 'Unknown']
+        asins = [b['asin'] for b in top_books]
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            for book, details in zip(top_books, executor.map(researcher.get_detailed_book_metrics, asins)):
+                book.update(details)
         
         # Save results
-        with open('market_results.json', 'w') as f:
-            json.dump(books, f, indent=2)
+        with open('market_results.json', 'wb') as f:
+            f.write(dump_json(books))
+        
+        con = open_book_store()
+        try:
+            save_books(con, books, query)
+        finally:
+            con.close()
         
         # Perform analysis
         analysis = researcher.analyze_market_opportunity(books, query)
         
         # Save analysis
-        with open('market_analysis.json', 'w') as f:
-            json.dump(analysis, f, indent=2)
+        with open('market_analysis.json', 'wb') as f:
+            f.write(dump_json(analysis))
         
-        print(json.dumps(analysis, indent=2))
+        print_json(analysis)
     
     elif command == "analyze":
-        # Load existing results
+        # Load stored results for this query, falling back to the last search
         try:
-            with open('market_results.json', 'r') as f:
-                books = json.load(f)
+            # Only read an existing store; connecting would create an empty one
+            books = []
+            if os.path.exists(BOOK_STORE):
+                con = open_book_store()
+                try:
+                    books = load_books(con, query)
+                finally:
+                    con.close()
+            
+            if not books:
+                with open('market_results.json', 'rb') as f:
+                    books = load_json(f.read())
             
             analysis = researcher.analyze_market_opportunity(books, query)
-            print(json.dumps(analysis, indent=2))
+            print_json(analysis)
             
-        except FileNotFoundError:
+        except (FileNotFoundError, sqlite3.Error):
             print("No market results found. Run search first.")
     
     elif command == "trends":
         social_analysis = analyze_social_trends(query)
-        print(json.dumps(social_analysis, indent=2))
+        print_json(social_analysis)
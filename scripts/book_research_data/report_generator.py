@@ -3,14 +3,53 @@
 import json
 import sys
 from datetime import datetime
-import statistics
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+BANNER = "=" * 80
+RULE = "-" * 40
+SUB_BANNER = "=" * 50
+SHORT_RULE = "-" * 20
+
+# Opportunity score verdicts, highest threshold first; the last band catches
+# every remaining score
+OPP_BANDS = (
+    (70, "   ✅ EXCELLENT OPPORTUNITY - Highly Recommended"),
+    (50, "   ⚡ GOOD OPPORTUNITY - Recommended with Strategy"),
+    (30, "   ⚠️  MODERATE OPPORTUNITY - Proceed with Caution"),
+    (float('-inf'), "   ❌ LOW OPPORTUNITY - Not Recommended"),
+)
+
+ACTION_ITEMS = f"""
+📋 ACTION ITEMS
+{SHORT_RULE}
+1. Research top 5 competitors in detail
+2. Analyze their reviews for improvement opportunities
+3. Consider unique angles or underserved sub-niches
+4. Plan content that addresses quality gaps identified
+5. Set competitive pricing based on analysis above
+"""
 
 def generate_comprehensive_report(market_file, trends_file=None):
     """Generate a comprehensive market research report"""
     
     try:
-        with open(market_file, 'r') as f:
-            market_data = json.load(f)
+        with open(market_file, 'rb') as f:
+            market_data = load_json(f.read())
     except FileNotFoundError:
         print("Market analysis file not found")
         return
@@ -18,190 +57,183 @@ def generate_comprehensive_report(market_file, trends_file=None):
     trends_data = {}
     if trends_file:
         try:
-            with open(trends_file, 'r') as f:
-                trends_data = json.load(f)
+            with open(trends_file, 'rb') as f:
+                trends_data = load_json(f.read())
         except FileNotFoundError:
             pass
     
-    print("=" * 80)
-    print(f"COMPREHENSIVE BOOK MARKET RESEARCH REPORT")
-    print("=" * 80)
-    print(f"Query: {market_data.get('query', 'Unknown')}")
-    print(f"Analysis Date: {market_data.get('analysis_date', 'Unknown')}")
-    print(f"Total Books Analyzed: {market_data.get('total_books_analyzed', 0)}")
-    print()
+    # Collect the report and write it in one go rather than line by line
+    out = []
+    emit = out.append
+    
+    emit(f"""{BANNER}
+COMPREHENSIVE BOOK MARKET RESEARCH REPORT
+{BANNER}
+Query: {market_data.get('query', 'Unknown')}
+Analysis Date: {market_data.get('analysis_date', 'Unknown')}
+Total Books Analyzed: {market_data.get('total_books_analyzed', 0)}
+""")
     
     # Opportunity Score
     opp_score = market_data.get('opportunity_score', 0)
-    print(f"🎯 OVERALL OPPORTUNITY SCORE: {opp_score}/100")
-    
-    if opp_score >= 70:
-        print("   ✅ EXCELLENT OPPORTUNITY - Highly Recommended")
-    elif opp_score >= 50:
-        print("   ⚡ GOOD OPPORTUNITY - Recommended with Strategy")
-    elif opp_score >= 30:
-        print("   ⚠️  MODERATE OPPORTUNITY - Proceed with Caution")
-    else:
-        print("   ❌ LOW OPPORTUNITY - Not Recommended")
-    print()
+    emit(f"🎯 OVERALL OPPORTUNITY SCORE: {opp_score}/100")
+    emit(next(verdict for threshold, verdict in OPP_BANDS if opp_score >= threshold))
+    emit("")
     
     # Competition Analysis
     comp = market_data.get('competition', {})
-    print("📊 COMPETITION ANALYSIS")
-    print("-" * 40)
-    print(f"Total Competitors: {comp.get('total_competitors', 0)}")
-    print(f"Average Reviews: {comp.get('avg_reviews', 0):,.0f}")
-    print(f"Median Reviews: {comp.get('median_reviews', 0):,.0f}")
-    print(f"Competition Level: {comp.get('competition_level', 'Unknown').title()}")
-    print(f"Author Diversity: {comp.get('author_diversity', 0)} unique authors")
+    competition_level = comp.get('competition_level', 'Unknown')
+    emit("📊 COMPETITION ANALYSIS")
+    emit(RULE)
+    emit(f"Total Competitors: {comp.get('total_competitors', 0)}")
+    emit(f"Average Reviews: {comp.get('avg_reviews', 0):,.0f}")
+    emit(f"Median Reviews: {comp.get('median_reviews', 0):,.0f}")
+    emit(f"Competition Level: {competition_level.title()}")
+    emit(f"Author Diversity: {comp.get('author_diversity', 0)} unique authors")
     
     dominant_authors = comp.get('dominant_authors', {})
     if dominant_authors:
-        print("Top Authors by Book Count:")
+        emit("Top Authors by Book Count:")
         for author, count in list(dominant_authors.items())[:3]:
-            print(f"  • {author}: {count} books")
-    print()
+            emit(f"  • {author}: {count} books")
+    emit("")
     
     # Demand Analysis
     demand = market_data.get('demand', {})
-    print("📈 DEMAND ANALYSIS")
-    print("-" * 40)
-    print(f"Total Market Reviews: {demand.get('total_market_reviews', 0):,}")
-    print(f"Avg Reviews per Book: {demand.get('avg_reviews_per_book', 0):.1f}")
-    print(f"Market Activity Level: {demand.get('market_activity_level', 'Unknown').title()}")
-    print(f"Estimated Monthly Searches: {demand.get('estimated_monthly_searches', 0):,}")
-    print()
+    activity_level = demand.get('market_activity_level', 'Unknown')
+    emit("📈 DEMAND ANALYSIS")
+    emit(RULE)
+    emit(f"Total Market Reviews: {demand.get('total_market_reviews', 0):,}")
+    emit(f"Avg Reviews per Book: {demand.get('avg_reviews_per_book', 0):.1f}")
+    emit(f"Market Activity Level: {activity_level.title()}")
+    emit(f"Estimated Monthly Searches: {demand.get('estimated_monthly_searches', 0):,}")
+    emit("")
     
     # Quality Gaps Analysis
     gaps = market_data.get('quality_gaps', {})
-    print("🎯 QUALITY OPPORTUNITIES")
-    print("-" * 40)
-    print(f"Low-Rated Books (Under 4.0): {gaps.get('low_rated_opportunities', 0)}")
+    low_rated = gaps.get('low_rated_opportunities', 0)
+    emit("🎯 QUALITY OPPORTUNITIES")
+    emit(RULE)
+    emit(f"Low-Rated Books (Under 4.0): {low_rated}")
     
     missing_formats = gaps.get('missing_formats', [])
     if missing_formats:
-        print("Missing Formats (Opportunities):")
+        emit("Missing Formats (Opportunities):")
         for fmt in missing_formats:
-            print(f"  • {fmt.title()}")
+            emit(f"  • {fmt.title()}")
     
     oversaturated = gaps.get('oversaturated_formats', [])
     if oversaturated:
-        print("Oversaturated Formats (Avoid):")
+        emit("Oversaturated Formats (Avoid):")
         for fmt in oversaturated:
-            print(f"  • {fmt.title()}")
-    print()
+            emit(f"  • {fmt.title()}")
+    emit("")
     
     # Pricing Analysis
     pricing = market_data.get('pricing', {})
     if not pricing.get('error'):
-        print("💰 PRICING ANALYSIS")
-        print("-" * 40)
-        print(f"Average Price: ${pricing.get('avg_price', 0):.2f}")
-        print(f"Median Price: ${pricing.get('median_price', 0):.2f}")
+        emit("💰 PRICING ANALYSIS")
+        emit(RULE)
+        emit(f"Average Price: ${pricing.get('avg_price', 0):.2f}")
+        emit(f"Median Price: ${pricing.get('median_price', 0):.2f}")
         
         price_dist = pricing.get('price_range_distribution', {})
-        print("Price Distribution:")
-        print(f"  • Under $3: {price_dist.get('under_3', 0)} books")
-        print(f"  • $3-$6: {price_dist.get('3_to_6', 0)} books")
-        print(f"  • $6-$10: {price_dist.get('6_to_10', 0)} books")
-        print(f"  • Over $10: {price_dist.get('over_10', 0)} books")
+        emit(f"""Price Distribution:
+  • Under $3: {price_dist.get('under_3', 0)} books
+  • $3-$6: {price_dist.get('3_to_6', 0)} books
+  • $6-$10: {price_dist.get('6_to_10', 0)} books
+  • Over $10: {price_dist.get('over_10', 0)} books""")
         
         strategy = pricing.get('pricing_strategy', '')
-        print(f"Recommended Strategy: {strategy.replace('_', ' ').title()}")
+        emit(f"Recommended Strategy: {strategy.replace('_', ' ').title()}")
         
         price_gaps = pricing.get('optimal_price_gap', [])
         if price_gaps:
-            print("Price Gap Opportunities:")
+            emit("Price Gap Opportunities:")
             for gap in price_gaps[:3]:
-                print(f"  • ${gap.get('gap_start', 0):.2f} - ${gap.get('gap_end', 0):.2f} (Gap: ${gap.get('gap_size', 0):.2f})")
-        print()
+                emit(f"  • ${gap.get('gap_start', 0):.2f} - ${gap.get('gap_end', 0):.2f} (Gap: ${gap.get('gap_size', 0):.2f})")
+        emit("")
     
     # Market Timing
     timing = market_data.get('timing', {})
-    print("⏰ MARKET TIMING")
-    print("-" * 40)
-    print(f"Recent Publications: {timing.get('recent_publications', 0)}")
-    print(f"Market Freshness: {timing.get('market_freshness', 0):.1%}")
-    print(f"Publishing Trend: {timing.get('publishing_trend', 'Unknown').title()}")
-    print(f"Opportunity Timing: {timing.get('opportunity_timing', 'Unknown').title()}")
-    print()
+    opportunity_timing = timing.get('opportunity_timing', 'Unknown')
+    emit("⏰ MARKET TIMING")
+    emit(RULE)
+    emit(f"Recent Publications: {timing.get('recent_publications', 0)}")
+    emit(f"Market Freshness: {timing.get('market_freshness', 0):.1%}")
+    emit(f"Publishing Trend: {timing.get('publishing_trend', 'Unknown').title()}")
+    emit(f"Opportunity Timing: {opportunity_timing.title()}")
+    emit("")
     
     # Trends Analysis (if available)
     if trends_data:
         google_trends = trends_data.get('google_trends', {})
         youtube_trends = trends_data.get('youtube_trends', {})
         
-        print("🔥 TREND ANALYSIS")
-        print("-" * 40)
+        emit("🔥 TREND ANALYSIS")
+        emit(RULE)
         if google_trends:
-            print(f"Google Results: {google_trends.get('total_results', 0):,}")
-            print(f"Related Questions: {google_trends.get('related_questions', 0)}")
-            print(f"Trend Score: {google_trends.get('trend_score', 0)}/100")
+            emit(f"Google Results: {google_trends.get('total_results', 0):,}")
+            emit(f"Related Questions: {google_trends.get('related_questions', 0)}")
+            emit(f"Trend Score: {google_trends.get('trend_score', 0)}/100")
         
         if youtube_trends:
-            print(f"YouTube Interest: {youtube_trends.get('youtube_interest_level', 'Unknown').title()}")
-        print()
+            emit(f"YouTube Interest: {youtube_trends.get('youtube_interest_level', 'Unknown').title()}")
+        emit("")
     
     # Recommendations
-    print("💡 STRATEGIC RECOMMENDATIONS")
-    print("=" * 50)
+    emit("💡 STRATEGIC RECOMMENDATIONS")
+    emit(SUB_BANNER)
     
     if opp_score >= 50:
-        print("✅ PROCEED WITH THIS NICHE")
-        print("Key Success Factors:")
+        emit("✅ PROCEED WITH THIS NICHE")
+        emit("Key Success Factors:")
         
-        if comp.get('competition_level') == 'low':
-            print("  • Low competition - great entry opportunity")
+        if competition_level == 'low':
+            emit("  • Low competition - great entry opportunity")
         
-        if gaps.get('low_rated_opportunities', 0) > 0:
-            print(f"  • {gaps['low_rated_opportunities']} poorly rated books to outcompete")
+        if low_rated > 0:
+            emit(f"  • {low_rated} poorly rated books to outcompete")
         
         if missing_formats:
-            print(f"  • Missing formats to explore: {', '.join(missing_formats[:3])}")
+            emit(f"  • Missing formats to explore: {', '.join(missing_formats[:3])}")
         
-        if timing.get('opportunity_timing') == 'good':
-            print("  • Good timing - not oversaturated with recent releases")
+        if opportunity_timing == 'good':
+            emit("  • Good timing - not oversaturated with recent releases")
             
     else:
-        print("⚠️ CONSIDER ALTERNATIVE NICHES")
-        print("Risk Factors:")
+        emit("⚠️ CONSIDER ALTERNATIVE NICHES")
+        emit("Risk Factors:")
         
-        if comp.get('competition_level') == 'high':
-            print("  • High competition with established players")
+        if competition_level == 'high':
+            emit("  • High competition with established players")
         
-        if demand.get('market_activity_level') == 'low':
-            print("  • Low market demand indicators")
+        if activity_level == 'low':
+            emit("  • Low market demand indicators")
         
-        if timing.get('opportunity_timing') == 'competitive':
-            print("  • Market may be oversaturated")
-    
-    print()
-    print("📋 ACTION ITEMS")
-    print("-" * 20)
-    print("1. Research top 5 competitors in detail")
-    print("2. Analyze their reviews for improvement opportunities")  
-    print("3. Consider unique angles or underserved sub-niches")
-    print("4. Plan content that addresses quality gaps identified")
-    print("5. Set competitive pricing based on analysis above")
-    print()
+        if opportunity_timing == 'competitive':
+            emit("  • Market may be oversaturated")
+    
+    emit(ACTION_ITEMS)
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Export summary data
     summary = {
         'query': market_data.get('query'),
         'opportunity_score': opp_score,
-        'competition_level': comp.get('competition_level'),
-        'market_activity': demand.get('market_activity_level'),
+        'competition_level': competition_level,
+        'market_activity': activity_level,
         'recommended_action': 'proceed' if opp_score >= 50 else 'reconsider',
         'key_opportunities': missing_formats,
         'avg_price': pricing.get('avg_price', 0),
         'analysis_date': datetime.now().isoformat()
     }
     
-    with open('market_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    with open('market_summary.json', 'wb') as f:
+        f.write(dump_json(summary))
     
-    print("📄 Summary saved to: market_summary.json")
-    print("📊 Full analysis saved to: market_analysis.json")
+    sys.stdout.write("📄 Summary saved to: market_summary.json\n"
+                     "📊 Full analysis saved to: market_analysis.json\n")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
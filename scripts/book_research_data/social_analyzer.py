@@ -5,8 +5,31 @@ import json
 import sys
 import re
 from bs4 import BeautifulSoup
-import time
 from urllib.parse import quote_plus
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+REDDIT_RESULT_LIMIT = 10
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
 
 def analyze_instagram_hashtags(query):
     """Analyze Instagram hashtag popularity (simplified)"""
@@ -28,21 +51,21 @@ def analyze_instagram_hashtags(query):
 
 def analyze_reddit_communities(query):
     """Analyze Reddit communities for topic interest"""
-    search_url = f"https://www.reddit.com/search.json?q={quote_plus(query)}&type=sr"
+    # Only the top subreddits are used, so ask Reddit not to send the rest
+    search_url = f"https://www.reddit.com/search.json?q={quote_plus(query)}&type=sr&limit={REDDIT_RESULT_LIMIT}"
     
     headers = {
         'User-Agent': 'BookResearch/1.0'
     }
     
     try:
-        time.sleep(2)  # Rate limiting
         response = requests.get(search_url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response.content)
             subreddits = []
             
-            for item in data.get('data', {}).get('children', [])[:10]:
+            for item in data.get('data', {}).get('children', [])[:REDDIT_RESULT_LIMIT]:
                 sub_data = item.get('data', {})
                 subreddits.append({
                     'name': sub_data.get('display_name', ''),
@@ -85,14 +108,15 @@ def analyze_pinterest_interest(query):
 
 def get_social_research_checklist(query):
     """Generate comprehensive social media research checklist"""
+    tag = query.replace(' ', '')
     return {
         'query': query,
         'platforms': {
             'tiktok': {
                 'hashtags_to_check': [
-                    f"#{query.replace(' ', '')}",
-                    f"#{query.replace(' ', '')}tips", 
-                    f"#{query.replace(' ', '')}hack"
+                    f"#{tag}",
+                    f"#{tag}tips", 
+                    f"#{tag}hack"
                 ],
                 'metrics_to_note': [
                     "Total hashtag views",
@@ -103,7 +127,7 @@ def get_social_research_checklist(query):
             },
             'instagram': {
                 'research_areas': [
-                    f"#{query.replace(' ', '')} hashtag page",
+                    f"#{tag} hashtag page",
                     f"Stories mentioning {query}",
                     f"Reels with {query} audio/hashtags",
                     f"Business accounts in niche"
@@ -156,4 +180,4 @@ if __name__ == "__main__":
         'research_checklist': get_social_research_checklist(query)
     }
     
-    print(json.dumps(analysis, indent=2))
+    print_json(analysis)
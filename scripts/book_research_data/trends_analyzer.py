@@ -2,12 +2,98 @@
 
 import requests
 import json
+import os
 import sys
 import re
-from bs4 import BeautifulSoup
+import hashlib
+import tempfile
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # C parser, much faster than html.parser
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote_plus
 from datetime import datetime, timedelta
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+# One keep-alive session shared by the Google and YouTube lookups, retrying
+# throttling and transient server errors instead of dropping the analysis
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+})
+
+_RESULT_STATS_RE = re.compile(r'About ([\d,]+)')
+_RECENT_RE = re.compile(r'hours ago|days ago|week ago')
+_DAYS_AGO_RE = re.compile(rb'days? ago')
+
+# Every element the Google analysis reads is a div or an a; this skips
+# building nodes for the scripts, styles and svg that make up most of the page
+GOOGLE_STRAINER = SoupStrainer(['div', 'a'])
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
+
+# Trend counts are stable for hours, so repeat runs read them from disk
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+TRENDS_CACHE_TTL = 6 * 3600
+
+# The first 256 KiB of a YouTube results page holds enough video renderers to
+# bucket interest; the rest is mostly player config and scripts
+YOUTUBE_BYTE_LIMIT = 256 * 1024
+
+def cache_get(key, ttl):
+    """Return the cached value for key, or None if missing or older than ttl seconds"""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as f:
+                return load_json(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def cache_set(key, value):
+    """Atomically store value under key; cache failures never abort the analysis"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            f.write(dump_json(value, indent=False))
+        os.replace(f.name, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError as e:
+        print(f"Cache write failed for {key}: {e}")
+
+def trends_cache_key(source, query):
+    """Cache key for one source's trend analysis of query"""
+    return f"{source}_trends_" + hashlib.sha1(query.encode()).hexdigest()
 
 def analyze_google_search_trends(query):
     """
@@ -16,41 +102,53 @@ def analyze_google_search_trends(query):
     """
     
     # Search Google for the query and analyze result characteristics
-    search_url = f"https://www.google.com/search?q={quote_plus(query)}"
+    cache_key = trends_cache_key('google', query)
+    cached = cache_get(cache_key, TRENDS_CACHE_TTL)
+    if cached is not None:
+        return cached
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    search_url = f"https://www.google.com/search?q={quote_plus(query)}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(search_url, timeout=10)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, PARSER, parse_only=GOOGLE_STRAINER)
+        
+        # One walk over the divs picks out the result stats, the "People also
+        # ask" pairs and the related-searches block instead of three searches
+        results_text = None
+        related_section = None
+        related_questions = 0
+        for div in soup.find_all('div'):
+            if results_text is None and div.get('id') == 'result-stats':
+                results_text = div
+            if 'related-question-pair' in div.get('class', ()):
+                # "People also ask" - indicates active searches
+                related_questions += 1
+            if related_section is None and div.get('data-async-context') == 'async_id:rso;':
+                related_section = div
         
         # Count results
-        results_text = soup.find('div', id='result-stats')
         result_count = 0
         if results_text:
-            count_match = re.search(r'About ([\d,]+)', results_text.get_text())
+            count_match = _RESULT_STATS_RE.search(results_text.get_text())
             if count_match:
                 result_count = int(count_match.group(1).replace(',', ''))
         
-        # Look for "People also ask" - indicates active searches
-        people_ask = soup.find_all('div', class_='related-question-pair')
-        related_questions = len(people_ask)
-        
-        # Look for recent results
-        recent_indicators = len(soup.find_all(text=re.compile(r'hours ago|days ago|week ago')))
+        # Look for recent results: one regex pass over the page text instead of
+        # testing every text node separately; the newline separator keeps a
+        # match from spanning two adjacent text nodes
+        recent_indicators = len(_RECENT_RE.findall(soup.get_text("\n")))
         
         # Analyze search suggestions (related searches)
         related_searches = []
-        related_section = soup.find('div', {'data-async-context': 'async_id:rso;'})
         if related_section:
             links = related_section.find_all('a')
             for link in links[:10]:
                 if link.get_text():
                     related_searches.append(link.get_text().strip())
         
-        return {
+        result = {
             'query': query,
             'total_results': result_count,
             'related_questions': related_questions,
@@ -59,6 +157,11 @@ def analyze_google_search_trends(query):
             'trend_score': calculate_trend_score(result_count, related_questions, recent_indicators),
             'analysis_date': datetime.now().isoformat()
         }
+        # Consent, captcha and "unusual traffic" pages have no result stats;
+        # only cache real result pages so those are retried next run
+        if results_text:
+            cache_set(cache_key, result)
+        return result
     
     except Exception as e:
         print(f"Error analyzing trends for {query}: {e}")
@@ -86,24 +189,40 @@ def calculate_trend_score(result_count, related_questions, recent_indicators):
 
 def analyze_youtube_trends(query):
     """Analyze YouTube search results for trend indicators"""
-    search_url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
+    cache_key = trends_cache_key('youtube', query)
+    cached = cache_get(cache_key, TRENDS_CACHE_TTL)
+    if cached is not None:
+        return cached
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    search_url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
+        with SESSION.get(search_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            # Stop downloading once the byte limit is reached
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(64 * 1024):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= YOUTUBE_BYTE_LIMIT:
+                    break
         
-        # Count video results (simplified)
-        video_count = response.text.count('videoRenderer')
-        recent_videos = response.text.count('day ago') + response.text.count('days ago')
+        # Count video results (simplified) on the raw bytes; decoding the
+        # page to str would only add a copy
+        body = b''.join(chunks)[:YOUTUBE_BYTE_LIMIT]
+        video_count = body.count(b'videoRenderer')
+        recent_videos = len(_DAYS_AGO_RE.findall(body))
         
-        return {
+        result = {
             'estimated_video_count': video_count,
             'recent_videos': recent_videos,
             'youtube_interest_level': 'high' if video_count > 20 else 'medium' if video_count > 10 else 'low'
         }
+        # A page without any video renderers is a block or consent page
+        if video_count:
+            cache_set(cache_key, result)
+        return result
     
     except Exception as e:
         print(f"Error analyzing YouTube trends: {e}")
@@ -116,12 +235,16 @@ if __name__ == "__main__":
     
     query = sys.argv[1]
     
-    google_trends = analyze_google_search_trends(query)
-    youtube_trends = analyze_youtube_trends(query)
+    # The two lookups hit independent hosts, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        google_future = executor.submit(analyze_google_search_trends, query)
+        youtube_future = executor.submit(analyze_youtube_trends, query)
+        google_trends = google_future.result()
+        youtube_trends = youtube_future.result()
     
     combined_analysis = {
         'google_trends': google_trends,
         'youtube_trends': youtube_trends
     }
     
-    print(json.dumps(combined_analysis, indent=2))
+    print_json(combined_analysis)
@@ -84,20 +84,187 @@ create_research_suite() {
 
 import requests
 import json
+import os
 import sys
 import time
+import math
+import hashlib
+import tempfile
 import re
 import csv
+import sqlite3
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus, urlencode
-from bs4 import BeautifulSoup
-import random
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # C parser, much faster than html.parser
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
-import statistics
+
+SEARCH_PAGES = 5
+RESULTS_PER_PAGE = 16  # organic results on an Amazon books search page
+DETAIL_WORKERS = 6
+REQUEST_TIMEOUT = (5, 15)  # (connect, read) seconds
+
+# Only build the parts of each page we read; the rest of the markup is skipped
+SEARCH_STRAINER = SoupStrainer('div', attrs={'data-component-type': 's-search-result'})
+DETAIL_STRAINER = SoupStrainer(id=['bookDescription_feature_div', 'detailBulletsWrapper_feature_div',
+                                   'detailBullets_feature_div', 'prodDetails'])
+
+# Patterns used by the per-result extraction helpers
+_NUMBER_RE = re.compile(r'\d+')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_PRICE_RE = re.compile(r'\$?(\d+\.?\d*)')
+_COMMA_TABLE = str.maketrans('', '', ',')
+
+# Detail-page labels and the values parsed out of them
+_BSR_LABEL_RE = re.compile(r'Best Sellers Rank|Amazon Best Sellers Rank')
+_PAGES_LABEL_RE = re.compile(r'Print length|File Size')
+_PUB_DATE_LABEL_RE = re.compile(r'Publication date')
+_DETAIL_LABELS = (('bsr', _BSR_LABEL_RE), ('pages', _PAGES_LABEL_RE),
+                  ('publication_date', _PUB_DATE_LABEL_RE))
+_BSR_RE = re.compile(r'#([\d,]+)')
+_CATEGORY_RE = re.compile(r'in\s+([^(]+)(?:\s+\([^)]+\))?')
+_INT_RE = re.compile(r'(\d+)')
+_YEAR_RE = re.compile(r'20\d{2}')
+
+# Title tokenization for keyword suggestions. For ASCII titles the translate
+# table lowercases letters, keeps digits/underscores (word characters that
+# disqualify a token) and turns everything else into a separator, which
+# yields the same words as _TITLE_WORD_RE without running the regex engine
+_TITLE_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_TITLE_TABLE = str.maketrans({c: c.lower() if c.isalnum() or c == '_' else ' '
+                              for c in map(chr, range(128))})
+_STOP_WORDS = frozenset({'the', 'and', 'for', 'with', 'your', 'how', 'guide', 'book', 'complete', 'ultimate'})
+
+# Upper bounds of the price-distribution buckets reported by analyze_pricing
+PRICE_EDGES = (3, 6, 10)
+PRICE_BANDS = ('under_3', '3_to_6', '6_to_10', 'over_10')
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
+
+def _mean(values):
+    """Arithmetic mean, or 0 for an empty list"""
+    return math.fsum(values) / len(values) if values else 0
+
+def _sorted_median(values):
+    """Median of an already sorted, non-empty list"""
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+# Books from every search, keyed by (query, ASIN), so repeat searches
+# upsert rows instead of rewriting one growing JSON file
+BOOK_STORE = 'market.db'
+
+def open_book_store(path=BOOK_STORE):
+    """Open the SQLite book store, creating the table on first use"""
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE IF NOT EXISTS books ('
+                'query TEXT, asin TEXT, payload TEXT, updated_at TEXT, '
+                'PRIMARY KEY (query, asin))')
+    return con
+
+def save_books(con, books, query):
+    """Upsert books found for query; books without an ASIN cannot be keyed and are skipped"""
+    rows = [(query, b['asin'], dump_json(b, indent=False).decode('utf-8'), b.get('extracted_at'))
+            for b in books if b.get('asin', 'Unknown') != 'Unknown']
+    with con:
+        con.executemany('INSERT OR REPLACE INTO books VALUES (?, ?, ?, ?)', rows)
+
+def load_books(con, query):
+    """Return every stored book for query, most recently saved last"""
+    cursor = con.execute('SELECT payload FROM books WHERE query = ? ORDER BY rowid', (query,))
+    return [load_json(payload) for (payload,) in cursor]
+
+# On-disk cache shared across runs; lives next to the scripts so the
+# research suite's 'clean' command clears it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+SEARCH_CACHE_TTL = 6 * 3600
+DETAIL_CACHE_TTL = 7 * 24 * 3600
+
+def cache_get(key, ttl):
+    """Return the cached value for key, or None if missing or older than ttl seconds"""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as f:
+                return load_json(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def cache_set(key, value):
+    """Atomically store value under key; cache failures never abort the analysis"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            f.write(dump_json(value, indent=False))
+        os.replace(f.name, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError as e:
+        print(f"Cache write failed for {key}: {e}")
+
+class RateLimiter:
+    """Thread-safe token bucket allowing max_calls requests per period"""
+    def __init__(self, max_calls, period):
+        self.max_calls = max_calls
+        self.period = period
+        self.tokens = max_calls
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                refill = (now - self.updated) * self.max_calls / self.period
+                self.tokens = min(self.max_calls, self.tokens + refill)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) * self.period / self.max_calls
+            time.sleep(delay)
 
 class MarketResearcher:
     def __init__(self, config=None):
         self.session = requests.Session()
+        # Keep-alive pool sized above the worker count, retrying throttling and
+        # transient server errors with backoff
+        retry = Retry(total=3, backoff_factor=0.4,
+                      status_forcelist=(429, 500, 502, 503, 504),
+                      allowed_methods=frozenset(['GET']))
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Language': 'en-US,en;q=0.9',
@@ -106,41 +273,84 @@ class MarketResearcher:
         self.session.headers.update(self.headers)
         self.config = config or {}
         self.rate_limit_delay = 2
+        # Pages are fetched concurrently, so politeness comes from a shared
+        # token bucket rather than a sleep between sequential requests
+        self.rate_limiter = RateLimiter(max_calls=3, period=self.rate_limit_delay)
 
     def search_amazon_comprehensive(self, query, max_results=50):
         """Comprehensive Amazon search with detailed metrics"""
         print(f"🔍 Searching Amazon for: '{query}'")
         
-        books = []
-        page = 1
+        urls = [f"https://www.amazon.com/s?k={quote_plus(query)}&i=stripbooks&page={page}"
+                for page in range(1, SEARCH_PAGES + 1)]
         
-        while len(books) < max_results and page <= 5:
-            url = f"https://www.amazon.com/s?k={quote_plus(query)}&i=stripbooks&page={page}"
+        books = []
+        stop = threading.Event()
+        with ThreadPoolExecutor(max_workers=SEARCH_PAGES) as executor:
+            futures = []
             
-            try:
-                time.sleep(self.rate_limit_delay)
-                response = self.session.get(url, timeout=15, verify=False)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                results = soup.find_all('div', {'data-component-type': 's-search-result'})
-                
-                if not results:
+            def request_pages(still_needed):
+                # Queue only as many further pages as the shortfall calls for
+                wanted = min(SEARCH_PAGES, len(futures) + math.ceil(still_needed / RESULTS_PER_PAGE))
+                for url in urls[len(futures):wanted]:
+                    futures.append(executor.submit(self.fetch_search_page, url, query, stop))
+            
+            request_pages(max_results)
+            
+            # Merge in page order, stopping at the first empty or failed page
+            page = 0
+            while page < len(futures):
+                future = futures[page]
+                page += 1
+                try:
+                    page_books = future.result()
+                except Exception as e:
+                    print(f"Error on page {page}: {e}")
                     break
                 
-                for result in results:
-                    if len(books) >= max_results:
-                        break
-                    
-                    book = self.extract_comprehensive_book_data(result, query)
-                    if book:
-                        books.append(book)
+                if not page_books:
+                    break
                 
-                page += 1
+                books.extend(page_books[:max_results - len(books)])
+                if len(books) >= max_results:
+                    break
                 
-            except Exception as e:
-                print(f"Error on page {page}: {e}")
-                break
+                # Every queued page is merged and still short; queue more
+                if page == len(futures):
+                    request_pages(max_results - len(books))
+            
+            # Pages still waiting on the rate limiter are no longer needed
+            stop.set()
+        
+        return books
+
+    def fetch_search_page(self, url, query, stop):
+        """Fetch and extract one search results page (runs in a worker thread)"""
+        cache_key = 'amazon_search_' + hashlib.sha1(url.encode()).hexdigest()
+        cached = cache_get(cache_key, SEARCH_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        self.rate_limiter.wait()
+        if stop.is_set():
+            return []
+        with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            # Parse from the raw stream so the body is not also cached on response.content
+            response.raw.decode_content = True
+            soup = BeautifulSoup(response.raw, PARSER, parse_only=SEARCH_STRAINER)
+        
+        results = soup.find_all('div', {'data-component-type': 's-search-result'}, recursive=False)
+        
+        books = []
+        for result in results:
+            book = self.extract_comprehensive_book_data(result, query)
+            if book:
+                books.append(book)
+        
+        # Empty pages may be a captcha or the end of results; only cache hits
+        if books:
+            cache_set(cache_key, books)
         
         return books
 
@@ -202,39 +412,46 @@ class MarketResearcher:
         """Get detailed metrics for specific book"""
         if asin == 'Unknown':
             return {}
+        
+        cache_key = f"amazon_detail_{asin}"
+        cached = cache_get(cache_key, DETAIL_CACHE_TTL)
+        if cached is not None:
+            return cached
             
         url = f"https://www.amazon.com/dp/{asin}"
         
         try:
-            time.sleep(random.uniform(2, 4))
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self.rate_limiter.wait()
+            with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                soup = BeautifulSoup(response.raw, PARSER, parse_only=DETAIL_STRAINER)
             
             details = {}
+            labels = self.find_detail_labels(soup)
             
             # Best Seller Rank
-            bsr_elem = soup.find('span', string=re.compile(r'Best Sellers Rank|Amazon Best Sellers Rank'))
+            bsr_elem = labels.get('bsr')
             if bsr_elem:
                 bsr_parent = bsr_elem.find_parent()
                 if bsr_parent:
                     bsr_text = bsr_parent.get_text()
-                    bsr_match = re.search(r'#([\d,]+)', bsr_text)
+                    bsr_match = _BSR_RE.search(bsr_text)
                     details['bsr'] = int(bsr_match.group(1).replace(',', '')) if bsr_match else None
                     
                     # Extract categories
-                    categories = re.findall(r'in\s+([^(]+)(?:\s+\([^)]+\))?', bsr_text)
+                    categories = _CATEGORY_RE.findall(bsr_text)
                     details['categories'] = [cat.strip() for cat in categories[:3]]
 
             # Page count
-            pages_elem = soup.find('span', string=re.compile(r'Print length|File Size'))
+            pages_elem = labels.get('pages')
             if pages_elem:
                 pages_text = pages_elem.find_next().get_text()
-                pages_match = re.search(r'(\d+)', pages_text)
+                pages_match = _INT_RE.search(pages_text)
                 details['pages'] = int(pages_match.group(1)) if pages_match else None
 
             # Publication date
-            pub_elem = soup.find('span', string=re.compile(r'Publication date'))
+            pub_elem = labels.get('publication_date')
             if pub_elem:
                 details['publication_date'] = pub_elem.find_next().get_text().strip()
 
@@ -245,12 +462,28 @@ class MarketResearcher:
                 details['description_length'] = len(desc_text.strip())
                 details['description_quality'] = self.analyze_description_quality(desc_text)
 
+            if details:
+                cache_set(cache_key, details)
             return details
 
         except Exception as e:
             print(f"Error getting detailed metrics for {asin}: {e}")
             return {}
 
+    def find_detail_labels(self, soup):
+        """Locate the detail-bullet label spans in a single walk over the page"""
+        labels = {}
+        for span in soup.find_all('span'):
+            text = span.string
+            if text is None:
+                continue
+            for key, pattern in _DETAIL_LABELS:
+                if key not in labels and pattern.search(text):
+                    labels[key] = span
+            if len(labels) == len(_DETAIL_LABELS):
+                break
+        return labels
+
     def analyze_market_opportunity(self, books, query):
         """Comprehensive market opportunity analysis"""
         if not books:
@@ -284,45 +517,60 @@ class MarketResearcher:
 
     def analyze_competition(self, books):
         """Analyze competitive landscape"""
-        valid_books = [b for b in books if b.get('reviews_count', 0) > 0]
+        # Transpose the reviewed books into per-field columns in one pass
+        reviews = []
+        ratings = []
+        authors = []
+        for b in books:
+            reviews_count = b.get('reviews_count', 0)
+            if reviews_count <= 0:
+                continue
+            reviews.append(reviews_count)
+            if b.get('rating', 0) > 0:
+                ratings.append(b['rating'])
+            authors.append(b.get('author', 'Unknown'))
         
-        if not valid_books:
+        if not reviews:
             return {'error': 'No valid books for analysis'}
 
-        reviews = [b['reviews_count'] for b in valid_books]
-        ratings = [b['rating'] for b in valid_books if b.get('rating', 0) > 0]
+        # Sort once; min, max and median all come from the sorted list
+        reviews.sort()
         
         # Author diversity
-        authors = [b.get('author', 'Unknown') for b in valid_books]
         author_counts = Counter(authors)
         
         return {
-            'total_competitors': len(valid_books),
-            'avg_reviews': statistics.mean(reviews),
-            'median_reviews': statistics.median(reviews),
-            'max_reviews': max(reviews),
-            'min_reviews': min(reviews),
-            'avg_rating': statistics.mean(ratings) if ratings else 0,
-            'author_diversity': len(set(authors)),
+            'total_competitors': len(reviews),
+            'avg_reviews': _mean(reviews),
+            'median_reviews': _sorted_median(reviews),
+            'max_reviews': reviews[-1],
+            'min_reviews': reviews[0],
+            'avg_rating': _mean(ratings),
+            'author_diversity': len(author_counts),
             'dominant_authors': dict(author_counts.most_common(5)),
             'competition_level': self.assess_competition_level(reviews, ratings)
         }
 
     def analyze_demand(self, books, query):
         """Analyze market demand indicators"""
-        total_reviews = sum(b.get('reviews_count', 0) for b in books)
+        # Total reviews and recent activity (books with reviews in estimated
+        # recent period) gathered in one pass
+        total_reviews = 0
+        active_books = 0
+        for b in books:
+            reviews_count = b.get('reviews_count', 0)
+            total_reviews += reviews_count
+            if reviews_count > 50:
+                active_books += 1
         
         # Estimate search volume from results
         result_density = len(books)
         
-        # Recent activity (books with reviews in estimated recent period)
-        recent_books = [b for b in books if b.get('reviews_count', 0) > 50]
-        
         return {
             'total_market_reviews': total_reviews,
             'avg_reviews_per_book': total_reviews / len(books) if books else 0,
             'result_density': result_density,
-            'active_books': len(recent_books),
+            'active_books': active_books,
             'market_activity_level': self.assess_market_activity(total_reviews, len(books)),
             'estimated_monthly_searches': self.estimate_search_volume(query, result_density)
         }
@@ -331,16 +579,16 @@ class MarketResearcher:
         """Identify quality opportunities"""
         gaps = {}
         
-        # Rating gaps
-        low_rated = [b for b in books if b.get('rating', 5) < 4.0 and b.get('reviews_count', 0) > 20]
-        gaps['low_rated_opportunities'] = len(low_rated)
-        
-        # Format gaps
-        title_words = []
+        # Rating gaps and title word frequencies (for format gaps) in one pass
+        low_rated = 0
+        word_freq = Counter()
         for book in books:
-            title_words.extend(book.get('title', '').lower().split())
+            if book.get('rating', 5) < 4.0 and book.get('reviews_count', 0) > 20:
+                low_rated += 1
+            word_freq.update(book.get('title', '').lower().split())
+        gaps['low_rated_opportunities'] = low_rated
         
-        word_freq = Counter(title_words)
+        # Format gaps
         common_formats = ['guide', 'handbook', 'workbook', 'journal', 'planner']
         missing_formats = [fmt for fmt in common_formats if fmt not in word_freq]
         
@@ -351,21 +599,20 @@ class MarketResearcher:
 
     def analyze_pricing(self, books):
         """Analyze pricing opportunities"""
-        prices = [b.get('price', 0) for b in books if b.get('price', 0) > 0]
+        prices = sorted(b.get('price', 0) for b in books if b.get('price', 0) > 0)
         
         if not prices:
             return {'error': 'No pricing data available'}
 
-        price_ranges = {
-            'under_3': len([p for p in prices if p < 3]),
-            '3_to_6': len([p for p in prices if 3 <= p < 6]),
-            '6_to_10': len([p for p in prices if 6 <= p < 10]),
-            'over_10': len([p for p in prices if p >= 10])
-        }
+        # Bucket every price in a single pass
+        counts = [0] * len(PRICE_BANDS)
+        for p in prices:
+            counts[bisect_right(PRICE_EDGES, p)] += 1
+        price_ranges = dict(zip(PRICE_BANDS, counts))
 
         return {
-            'avg_price': statistics.mean(prices),
-            'median_price': statistics.median(prices),
+            'avg_price': _mean(prices),
+            'median_price': _sorted_median(prices),
             'price_range_distribution': price_ranges,
             'optimal_price_gap': self.find_price_gaps(prices),
             'pricing_strategy': self.suggest_pricing_strategy(prices)
@@ -381,7 +628,7 @@ class MarketResearcher:
             pub_date = book.get('publication_date', '')
             if pub_date:
                 # Simple year extraction
-                year_match = re.search(r'20\d{2}', str(pub_date))
+                year_match = _YEAR_RE.search(str(pub_date))
                 if year_match:
                     year = int(year_match.group())
                     if year >= current_year - 2:
@@ -436,21 +683,21 @@ class MarketResearcher:
 
     # Helper methods
     def extract_number(self, text):
-        numbers = re.findall(r'[\d,]+', text.replace(',', ''))
-        return int(numbers[0]) if numbers else 0
+        number_match = _NUMBER_RE.search(text.translate(_COMMA_TABLE))
+        return int(number_match.group()) if number_match else 0
 
     def extract_rating(self, text):
-        rating_match = re.search(r'(\d+\.?\d*)', text)
+        rating_match = _RATING_RE.search(text)
         return float(rating_match.group(1)) if rating_match else 0.0
 
     def extract_price(self, text):
-        price_match = re.search(r'\$?(\d+\.?\d*)', text.replace(',', ''))
+        price_match = _PRICE_RE.search(text.translate(_COMMA_TABLE))
         return float(price_match.group(1)) if price_match else 0.0
 
     def estimate_publication_date(self, result_div):
         # Try to find publication indicators in the result
         date_text = result_div.get_text()
-        year_matches = re.findall(r'20\d{2}', date_text)
+        year_matches = _YEAR_RE.findall(date_text)
         return year_matches[-1] if year_matches else 'Unknown'
 
     def analyze_description_quality(self, text):
@@ -463,8 +710,8 @@ class MarketResearcher:
             return 'good'
 
     def assess_competition_level(self, reviews, ratings):
-        avg_reviews = statistics.mean(reviews) if reviews else 0
-        avg_rating = statistics.mean(ratings) if ratings else 0
+        avg_reviews = _mean(reviews)
+        avg_rating = _mean(ratings)
         
         if avg_reviews > 500 and avg_rating > 4.3:
             return 'high'
@@ -497,22 +744,18 @@ class MarketResearcher:
         return base_estimate
 
     def find_price_gaps(self, prices):
+        if len(prices) < 2:
+            return []
+        
         sorted_prices = sorted(prices)
-        gaps = []
-        
-        for i in range(len(sorted_prices) - 1):
-            gap = sorted_prices[i + 1] - sorted_prices[i]
-            if gap > 1.0:  # Significant price gap
-                gaps.append({
-                    'gap_start': sorted_prices[i],
-                    'gap_end': sorted_prices[i + 1],
-                    'gap_size': gap
-                })
         
-        return gaps
+        # Walk adjacent pairs; a gap over $1 is significant
+        return [{'gap_start': low, 'gap_end': high, 'gap_size': high - low}
+                for low, high in zip(sorted_prices, sorted_prices[1:])
+                if high - low > 1.0]
 
     def suggest_pricing_strategy(self, prices):
-        median_price = statistics.median(prices)
+        median_price = _sorted_median(sorted(prices))
         
         if median_price < 3:
             return 'premium_opportunity'
@@ -526,24 +769,26 @@ def analyze_social_trends(query):
     """Analyze social media trends (simplified version)"""
     # This would need API access for real implementation
     # For now, provide structure for manual research
+    tag = query.replace(' ', '')
     return {
-        'instagram_research': f"Search hashtag #{query.replace(' ', '')}",
-        'tiktok_research': f"Check TikTok for #{query.replace(' ', '')}",
+        'instagram_research': f"Search hashtag #{tag}",
+        'tiktok_research': f"Check TikTok for #{tag}",
         'youtube_research': f"Search YouTube for '{query} tutorial'",
-        'reddit_research': f"Search Reddit for r/{query.replace(' ', '')}"
+        'reddit_research': f"Search Reddit for r/{tag}"
     }
 
 def generate_keyword_suggestions(successful_titles):
     """Generate keyword suggestions from successful titles"""
-    all_words = []
+    word_freq = Counter()
     
     for title in successful_titles:
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', title.lower())
+        if title.isascii():
+            words = (w for w in title.translate(_TITLE_TABLE).split() if len(w) >= 3 and w.isalpha())
+        else:
+            words = _TITLE_WORD_RE.findall(title.lower())
         # Filter out common words
-        filtered_words = [w for w in words if w not in ['the', 'and', 'for', 'with', 'your', 'how', 'guide', 'book', 'complete', 'ultimate']]
-        all_words.extend(filtered_words)
+        word_freq.update(w for w in words if w not in _STOP_WORDS)
     
-    word_freq = Counter(all_words)
     return word_freq.most_common(20)
 
 if __name__ == "__main__":
@@ -563,38 +808,57 @@ if __name__ == "__main__":
         
         # Get detailed metrics for top books
         print(f"📊 Getting detailed metrics for {len(books)} books...")
-        for book in books[:20]:  # Limit detailed analysis to prevent rate limiting
-            details = researcher.get_detailed_book_metrics(book.get('asin', ''))
-            book.update(details)
+        # Limit detailed analysis to prevent rate limiting
+        top_books = [b for b in books[:20] if b.get('asin') != 'Unknown']
+        asins = [b['asin'] for b in top_books]
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            for book, details in zip(top_books, executor.map(researcher.get_detailed_book_metrics, asins)):
+                book.update(details)
         
         # Save results
-        with open('market_results.json', 'w') as f:
-            json.dump(books, f, indent=2)
+        with open('market_results.json', 'wb') as f:
+            f.write(dump_json(books))
+        
+        con = open_book_store()
+        try:
+            save_books(con, books, query)
+        finally:
+            con.close()
         
         # Perform analysis
         analysis = researcher.analyze_market_opportunity(books, query)
         
         # Save analysis
-        with open('market_analysis.json', 'w') as f:
-            json.dump(analysis, f, indent=2)
+        with open('market_analysis.json', 'wb') as f:
+            f.write(dump_json(analysis))
         
-        print(json.dumps(analysis, indent=2))
+        print_json(analysis)
     
     elif command == "analyze":
-        # Load existing results
+        # Load stored results for this query, falling back to the last search
         try:
-            with open('market_results.json', 'r') as f:
-                books = json.load(f)
+            # Only read an existing store; connecting would create an empty one
+            books = []
+            if os.path.exists(BOOK_STORE):
+                con = open_book_store()
+                try:
+                    books = load_books(con, query)
+                finally:
+                    con.close()
+            
+            if not books:
+                with open('market_results.json', 'rb') as f:
+                    books = load_json(f.read())
             
             analysis = researcher.analyze_market_opportunity(books, query)
-            print(json.dumps(analysis, indent=2))
+            print_json(analysis)
             
-        except FileNotFoundError:
+        except (FileNotFoundError, sqlite3.Error):
             print("No market results found. Run search first.")
     
     elif command == "trends":
         social_analysis = analyze_social_trends(query)
-        print(json.dumps(social_analysis, indent=2))
+        print_json(social_analysis)
 EOF
 
     chmod +x "$DATA_DIR/market_analyzer.py"
@@ -605,12 +869,98 @@ EOF
 
 import requests
 import json
+import os
 import sys
 import re
-from bs4 import BeautifulSoup
+import hashlib
+import tempfile
+from bs4 import BeautifulSoup, SoupStrainer
+try:
+    import lxml  # C parser, much faster than html.parser
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import quote_plus
 from datetime import datetime, timedelta
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+# One keep-alive session shared by the Google and YouTube lookups, retrying
+# throttling and transient server errors instead of dropping the analysis
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))))
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Language': 'en-US,en;q=0.9'
+})
+
+_RESULT_STATS_RE = re.compile(r'About ([\d,]+)')
+_RECENT_RE = re.compile(r'hours ago|days ago|week ago')
+_DAYS_AGO_RE = re.compile(rb'days? ago')
+
+# Every element the Google analysis reads is a div or an a; this skips
+# building nodes for the scripts, styles and svg that make up most of the page
+GOOGLE_STRAINER = SoupStrainer(['div', 'a'])
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
+
+# Trend counts are stable for hours, so repeat runs read them from disk
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+TRENDS_CACHE_TTL = 6 * 3600
+
+# The first 256 KiB of a YouTube results page holds enough video renderers to
+# bucket interest; the rest is mostly player config and scripts
+YOUTUBE_BYTE_LIMIT = 256 * 1024
+
+def cache_get(key, ttl):
+    """Return the cached value for key, or None if missing or older than ttl seconds"""
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'rb') as f:
+                return load_json(f.read())
+    except (OSError, ValueError):
+        pass
+    return None
+
+def cache_set(key, value):
+    """Atomically store value under key; cache failures never abort the analysis"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            f.write(dump_json(value, indent=False))
+        os.replace(f.name, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError as e:
+        print(f"Cache write failed for {key}: {e}")
+
+def trends_cache_key(source, query):
+    """Cache key for one source's trend analysis of query"""
+    return f"{source}_trends_" + hashlib.sha1(query.encode()).hexdigest()
 
 def analyze_google_search_trends(query):
     """
@@ -619,41 +969,53 @@ def analyze_google_search_trends(query):
     """
     
     # Search Google for the query and analyze result characteristics
-    search_url = f"https://www.google.com/search?q={quote_plus(query)}"
+    cache_key = trends_cache_key('google', query)
+    cached = cache_get(cache_key, TRENDS_CACHE_TTL)
+    if cached is not None:
+        return cached
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    search_url = f"https://www.google.com/search?q={quote_plus(query)}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(search_url, timeout=10)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, PARSER, parse_only=GOOGLE_STRAINER)
+        
+        # One walk over the divs picks out the result stats, the "People also
+        # ask" pairs and the related-searches block instead of three searches
+        results_text = None
+        related_section = None
+        related_questions = 0
+        for div in soup.find_all('div'):
+            if results_text is None and div.get('id') == 'result-stats':
+                results_text = div
+            if 'related-question-pair' in div.get('class', ()):
+                # "People also ask" - indicates active searches
+                related_questions += 1
+            if related_section is None and div.get('data-async-context') == 'async_id:rso;':
+                related_section = div
         
         # Count results
-        results_text = soup.find('div', id='result-stats')
         result_count = 0
         if results_text:
-            count_match = re.search(r'About ([\d,]+)', results_text.get_text())
+            count_match = _RESULT_STATS_RE.search(results_text.get_text())
             if count_match:
                 result_count = int(count_match.group(1).replace(',', ''))
         
-        # Look for "People also ask" - indicates active searches
-        people_ask = soup.find_all('div', class_='related-question-pair')
-        related_questions = len(people_ask)
-        
-        # Look for recent results
-        recent_indicators = len(soup.find_all(text=re.compile(r'hours ago|days ago|week ago')))
+        # Look for recent results: one regex pass over the page text instead of
+        # testing every text node separately; the newline separator keeps a
+        # match from spanning two adjacent text nodes
+        recent_indicators = len(_RECENT_RE.findall(soup.get_text("\n")))
         
         # Analyze search suggestions (related searches)
         related_searches = []
-        related_section = soup.find('div', {'data-async-context': 'async_id:rso;'})
         if related_section:
             links = related_section.find_all('a')
             for link in links[:10]:
                 if link.get_text():
                     related_searches.append(link.get_text().strip())
         
-        return {
+        result = {
             'query': query,
             'total_results': result_count,
             'related_questions': related_questions,
@@ -662,6 +1024,11 @@ def analyze_google_search_trends(query):
             'trend_score': calculate_trend_score(result_count, related_questions, recent_indicators),
             'analysis_date': datetime.now().isoformat()
         }
+        # Consent, captcha and "unusual traffic" pages have no result stats;
+        # only cache real result pages so those are retried next run
+        if results_text:
+            cache_set(cache_key, result)
+        return result
     
     except Exception as e:
         print(f"Error analyzing trends for {query}: {e}")
@@ -689,24 +1056,40 @@ def calculate_trend_score(result_count, related_questions, recent_indicators):
 
 def analyze_youtube_trends(query):
     """Analyze YouTube search results for trend indicators"""
-    search_url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
+    cache_key = trends_cache_key('youtube', query)
+    cached = cache_get(cache_key, TRENDS_CACHE_TTL)
+    if cached is not None:
+        return cached
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+    search_url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=10)
+        with SESSION.get(search_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            # Stop downloading once the byte limit is reached
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(64 * 1024):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received >= YOUTUBE_BYTE_LIMIT:
+                    break
         
-        # Count video results (simplified)
-        video_count = response.text.count('videoRenderer')
-        recent_videos = response.text.count('day ago') + response.text.count('days ago')
+        # Count video results (simplified) on the raw bytes; decoding the
+        # page to str would only add a copy
+        body = b''.join(chunks)[:YOUTUBE_BYTE_LIMIT]
+        video_count = body.count(b'videoRenderer')
+        recent_videos = len(_DAYS_AGO_RE.findall(body))
         
-        return {
+        result = {
             'estimated_video_count': video_count,
             'recent_videos': recent_videos,
             'youtube_interest_level': 'high' if video_count > 20 else 'medium' if video_count > 10 else 'low'
         }
+        # A page without any video renderers is a block or consent page
+        if video_count:
+            cache_set(cache_key, result)
+        return result
     
     except Exception as e:
         print(f"Error analyzing YouTube trends: {e}")
@@ -719,15 +1102,19 @@ if __name__ == "__main__":
     
     query = sys.argv[1]
     
-    google_trends = analyze_google_search_trends(query)
-    youtube_trends = analyze_youtube_trends(query)
+    # The two lookups hit independent hosts, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        google_future = executor.submit(analyze_google_search_trends, query)
+        youtube_future = executor.submit(analyze_youtube_trends, query)
+        google_trends = google_future.result()
+        youtube_trends = youtube_future.result()
     
     combined_analysis = {
         'google_trends': google_trends,
         'youtube_trends': youtube_trends
     }
     
-    print(json.dumps(combined_analysis, indent=2))
+    print_json(combined_analysis)
 EOF
 
     chmod +x "$DATA_DIR/trends_analyzer.py"
@@ -739,14 +1126,53 @@ EOF
 import json
 import sys
 from datetime import datetime
-import statistics
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+BANNER = "=" * 80
+RULE = "-" * 40
+SUB_BANNER = "=" * 50
+SHORT_RULE = "-" * 20
+
+# Opportunity score verdicts, highest threshold first; the last band catches
+# every remaining score
+OPP_BANDS = (
+    (70, "   ✅ EXCELLENT OPPORTUNITY - Highly Recommended"),
+    (50, "   ⚡ GOOD OPPORTUNITY - Recommended with Strategy"),
+    (30, "   ⚠️  MODERATE OPPORTUNITY - Proceed with Caution"),
+    (float('-inf'), "   ❌ LOW OPPORTUNITY - Not Recommended"),
+)
+
+ACTION_ITEMS = f"""
+📋 ACTION ITEMS
+{SHORT_RULE}
+1. Research top 5 competitors in detail
+2. Analyze their reviews for improvement opportunities
+3. Consider unique angles or underserved sub-niches
+4. Plan content that addresses quality gaps identified
+5. Set competitive pricing based on analysis above
+"""
 
 def generate_comprehensive_report(market_file, trends_file=None):
     """Generate a comprehensive market research report"""
     
     try:
-        with open(market_file, 'r') as f:
-            market_data = json.load(f)
+        with open(market_file, 'rb') as f:
+            market_data = load_json(f.read())
     except FileNotFoundError:
         print("Market analysis file not found")
         return
@@ -754,190 +1180,183 @@ def generate_comprehensive_report(market_file, trends_file=None):
     trends_data = {}
     if trends_file:
         try:
-            with open(trends_file, 'r') as f:
-                trends_data = json.load(f)
+            with open(trends_file, 'rb') as f:
+                trends_data = load_json(f.read())
         except FileNotFoundError:
             pass
     
-    print("=" * 80)
-    print(f"COMPREHENSIVE BOOK MARKET RESEARCH REPORT")
-    print("=" * 80)
-    print(f"Query: {market_data.get('query', 'Unknown')}")
-    print(f"Analysis Date: {market_data.get('analysis_date', 'Unknown')}")
-    print(f"Total Books Analyzed: {market_data.get('total_books_analyzed', 0)}")
-    print()
+    # Collect the report and write it in one go rather than line by line
+    out = []
+    emit = out.append
+    
+    emit(f"""{BANNER}
+COMPREHENSIVE BOOK MARKET RESEARCH REPORT
+{BANNER}
+Query: {market_data.get('query', 'Unknown')}
+Analysis Date: {market_data.get('analysis_date', 'Unknown')}
+Total Books Analyzed: {market_data.get('total_books_analyzed', 0)}
+""")
     
     # Opportunity Score
     opp_score = market_data.get('opportunity_score', 0)
-    print(f"🎯 OVERALL OPPORTUNITY SCORE: {opp_score}/100")
-    
-    if opp_score >= 70:
-        print("   ✅ EXCELLENT OPPORTUNITY - Highly Recommended")
-    elif opp_score >= 50:
-        print("   ⚡ GOOD OPPORTUNITY - Recommended with Strategy")
-    elif opp_score >= 30:
-        print("   ⚠️  MODERATE OPPORTUNITY - Proceed with Caution")
-    else:
-        print("   ❌ LOW OPPORTUNITY - Not Recommended")
-    print()
+    emit(f"🎯 OVERALL OPPORTUNITY SCORE: {opp_score}/100")
+    emit(next(verdict for threshold, verdict in OPP_BANDS if opp_score >= threshold))
+    emit("")
     
     # Competition Analysis
     comp = market_data.get('competition', {})
-    print("📊 COMPETITION ANALYSIS")
-    print("-" * 40)
-    print(f"Total Competitors: {comp.get('total_competitors', 0)}")
-    print(f"Average Reviews: {comp.get('avg_reviews', 0):,.0f}")
-    print(f"Median Reviews: {comp.get('median_reviews', 0):,.0f}")
-    print(f"Competition Level: {comp.get('competition_level', 'Unknown').title()}")
-    print(f"Author Diversity: {comp.get('author_diversity', 0)} unique authors")
+    competition_level = comp.get('competition_level', 'Unknown')
+    emit("📊 COMPETITION ANALYSIS")
+    emit(RULE)
+    emit(f"Total Competitors: {comp.get('total_competitors', 0)}")
+    emit(f"Average Reviews: {comp.get('avg_reviews', 0):,.0f}")
+    emit(f"Median Reviews: {comp.get('median_reviews', 0):,.0f}")
+    emit(f"Competition Level: {competition_level.title()}")
+    emit(f"Author Diversity: {comp.get('author_diversity', 0)} unique authors")
     
     dominant_authors = comp.get('dominant_authors', {})
     if dominant_authors:
-        print("Top Authors by Book Count:")
+        emit("Top Authors by Book Count:")
         for author, count in list(dominant_authors.items())[:3]:
-            print(f"  • {author}: {count} books")
-    print()
+            emit(f"  • {author}: {count} books")
+    emit("")
     
     # Demand Analysis
     demand = market_data.get('demand', {})
-    print("📈 DEMAND ANALYSIS")
-    print("-" * 40)
-    print(f"Total Market Reviews: {demand.get('total_market_reviews', 0):,}")
-    print(f"Avg Reviews per Book: {demand.get('avg_reviews_per_book', 0):.1f}")
-    print(f"Market Activity Level: {demand.get('market_activity_level', 'Unknown').title()}")
-    print(f"Estimated Monthly Searches: {demand.get('estimated_monthly_searches', 0):,}")
-    print()
+    activity_level = demand.get('market_activity_level', 'Unknown')
+    emit("📈 DEMAND ANALYSIS")
+    emit(RULE)
+    emit(f"Total Market Reviews: {demand.get('total_market_reviews', 0):,}")
+    emit(f"Avg Reviews per Book: {demand.get('avg_reviews_per_book', 0):.1f}")
+    emit(f"Market Activity Level: {activity_level.title()}")
+    emit(f"Estimated Monthly Searches: {demand.get('estimated_monthly_searches', 0):,}")
+    emit("")
     
     # Quality Gaps Analysis
     gaps = market_data.get('quality_gaps', {})
-    print("🎯 QUALITY OPPORTUNITIES")
-    print("-" * 40)
-    print(f"Low-Rated Books (Under 4.0): {gaps.get('low_rated_opportunities', 0)}")
+    low_rated = gaps.get('low_rated_opportunities', 0)
+    emit("🎯 QUALITY OPPORTUNITIES")
+    emit(RULE)
+    emit(f"Low-Rated Books (Under 4.0): {low_rated}")
     
     missing_formats = gaps.get('missing_formats', [])
     if missing_formats:
-        print("Missing Formats (Opportunities):")
+        emit("Missing Formats (Opportunities):")
         for fmt in missing_formats:
-            print(f"  • {fmt.title()}")
+            emit(f"  • {fmt.title()}")
     
     oversaturated = gaps.get('oversaturated_formats', [])
     if oversaturated:
-        print("Oversaturated Formats (Avoid):")
+        emit("Oversaturated Formats (Avoid):")
         for fmt in oversaturated:
-            print(f"  • {fmt.title()}")
-    print()
+            emit(f"  • {fmt.title()}")
+    emit("")
     
     # Pricing Analysis
     pricing = market_data.get('pricing', {})
     if not pricing.get('error'):
-        print("💰 PRICING ANALYSIS")
-        print("-" * 40)
-        print(f"Average Price: ${pricing.get('avg_price', 0):.2f}")
-        print(f"Median Price: ${pricing.get('median_price', 0):.2f}")
+        emit("💰 PRICING ANALYSIS")
+        emit(RULE)
+        emit(f"Average Price: ${pricing.get('avg_price', 0):.2f}")
+        emit(f"Median Price: ${pricing.get('median_price', 0):.2f}")
         
         price_dist = pricing.get('price_range_distribution', {})
-        print("Price Distribution:")
-        print(f"  • Under $3: {price_dist.get('under_3', 0)} books")
-        print(f"  • $3-$6: {price_dist.get('3_to_6', 0)} books")
-        print(f"  • $6-$10: {price_dist.get('6_to_10', 0)} books")
-        print(f"  • Over $10: {price_dist.get('over_10', 0)} books")
+        emit(f"""Price Distribution:
+  • Under $3: {price_dist.get('under_3', 0)} books
+  • $3-$6: {price_dist.get('3_to_6', 0)} books
+  • $6-$10: {price_dist.get('6_to_10', 0)} books
+  • Over $10: {price_dist.get('over_10', 0)} books""")
         
         strategy = pricing.get('pricing_strategy', '')
-        print(f"Recommended Strategy: {strategy.replace('_', ' ').title()}")
+        emit(f"Recommended Strategy: {strategy.replace('_', ' ').title()}")
         
         price_gaps = pricing.get('optimal_price_gap', [])
         if price_gaps:
-            print("Price Gap Opportunities:")
+            emit("Price Gap Opportunities:")
             for gap in price_gaps[:3]:
-                print(f"  • ${gap.get('gap_start', 0):.2f} - ${gap.get('gap_end', 0):.2f} (Gap: ${gap.get('gap_size', 0):.2f})")
-        print()
+                emit(f"  • ${gap.get('gap_start', 0):.2f} - ${gap.get('gap_end', 0):.2f} (Gap: ${gap.get('gap_size', 0):.2f})")
+        emit("")
     
     # Market Timing
     timing = market_data.get('timing', {})
-    print("⏰ MARKET TIMING")
-    print("-" * 40)
-    print(f"Recent Publications: {timing.get('recent_publications', 0)}")
-    print(f"Market Freshness: {timing.get('market_freshness', 0):.1%}")
-    print(f"Publishing Trend: {timing.get('publishing_trend', 'Unknown').title()}")
-    print(f"Opportunity Timing: {timing.get('opportunity_timing', 'Unknown').title()}")
-    print()
+    opportunity_timing = timing.get('opportunity_timing', 'Unknown')
+    emit("⏰ MARKET TIMING")
+    emit(RULE)
+    emit(f"Recent Publications: {timing.get('recent_publications', 0)}")
+    emit(f"Market Freshness: {timing.get('market_freshness', 0):.1%}")
+    emit(f"Publishing Trend: {timing.get('publishing_trend', 'Unknown').title()}")
+    emit(f"Opportunity Timing: {opportunity_timing.title()}")
+    emit("")
     
     # Trends Analysis (if available)
     if trends_data:
         google_trends = trends_data.get('google_trends', {})
         youtube_trends = trends_data.get('youtube_trends', {})
         
-        print("🔥 TREND ANALYSIS")
-        print("-" * 40)
+        emit("🔥 TREND ANALYSIS")
+        emit(RULE)
         if google_trends:
-            print(f"Google Results: {google_trends.get('total_results', 0):,}")
-            print(f"Related Questions: {google_trends.get('related_questions', 0)}")
-            print(f"Trend Score: {google_trends.get('trend_score', 0)}/100")
+            emit(f"Google Results: {google_trends.get('total_results', 0):,}")
+            emit(f"Related Questions: {google_trends.get('related_questions', 0)}")
+            emit(f"Trend Score: {google_trends.get('trend_score', 0)}/100")
         
         if youtube_trends:
-            print(f"YouTube Interest: {youtube_trends.get('youtube_interest_level', 'Unknown').title()}")
-        print()
+            emit(f"YouTube Interest: {youtube_trends.get('youtube_interest_level', 'Unknown').title()}")
+        emit("")
     
     # Recommendations
-    print("💡 STRATEGIC RECOMMENDATIONS")
-    print("=" * 50)
+    emit("💡 STRATEGIC RECOMMENDATIONS")
+    emit(SUB_BANNER)
     
     if opp_score >= 50:
-        print("✅ PROCEED WITH THIS NICHE")
-        print("Key Success Factors:")
+        emit("✅ PROCEED WITH THIS NICHE")
+        emit("Key Success Factors:")
         
-        if comp.get('competition_level') == 'low':
-            print("  • Low competition - great entry opportunity")
+        if competition_level == 'low':
+            emit("  • Low competition - great entry opportunity")
         
-        if gaps.get('low_rated_opportunities', 0) > 0:
-            print(f"  • {gaps['low_rated_opportunities']} poorly rated books to outcompete")
+        if low_rated > 0:
+            emit(f"  • {low_rated} poorly rated books to outcompete")
         
         if missing_formats:
-            print(f"  • Missing formats to explore: {', '.join(missing_formats[:3])}")
+            emit(f"  • Missing formats to explore: {', '.join(missing_formats[:3])}")
         
-        if timing.get('opportunity_timing') == 'good':
-            print("  • Good timing - not oversaturated with recent releases")
+        if opportunity_timing == 'good':
+            emit("  • Good timing - not oversaturated with recent releases")
             
     else:
-        print("⚠️ CONSIDER ALTERNATIVE NICHES")
-        print("Risk Factors:")
+        emit("⚠️ CONSIDER ALTERNATIVE NICHES")
+        emit("Risk Factors:")
         
-        if comp.get('competition_level') == 'high':
-            print("  • High competition with established players")
+        if competition_level == 'high':
+            emit("  • High competition with established players")
         
-        if demand.get('market_activity_level') == 'low':
-            print("  • Low market demand indicators")
+        if activity_level == 'low':
+            emit("  • Low market demand indicators")
         
-        if timing.get('opportunity_timing') == 'competitive':
-            print("  • Market may be oversaturated")
+        if opportunity_timing == 'competitive':
+            emit("  • Market may be oversaturated")
     
-    print()
-    print("📋 ACTION ITEMS")
-    print("-" * 20)
-    print("1. Research top 5 competitors in detail")
-    print("2. Analyze their reviews for improvement opportunities")  
-    print("3. Consider unique angles or underserved sub-niches")
-    print("4. Plan content that addresses quality gaps identified")
-    print("5. Set competitive pricing based on analysis above")
-    print()
+    emit(ACTION_ITEMS)
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Export summary data
     summary = {
         'query': market_data.get('query'),
         'opportunity_score': opp_score,
-        'competition_level': comp.get('competition_level'),
-        'market_activity': demand.get('market_activity_level'),
+        'competition_level': competition_level,
+        'market_activity': activity_level,
         'recommended_action': 'proceed' if opp_score >= 50 else 'reconsider',
         'key_opportunities': missing_formats,
         'avg_price': pricing.get('avg_price', 0),
         'analysis_date': datetime.now().isoformat()
     }
     
-    with open('market_summary.json', 'w') as f:
-        json.dump(summary, f, indent=2)
+    with open('market_summary.json', 'wb') as f:
+        f.write(dump_json(summary))
     
-    print("📄 Summary saved to: market_summary.json")
-    print("📊 Full analysis saved to: market_analysis.json")
+    sys.stdout.write("📄 Summary saved to: market_summary.json\n"
+                     "📊 Full analysis saved to: market_analysis.json\n")
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -961,8 +1380,31 @@ import json
 import sys
 import re
 from bs4 import BeautifulSoup
-import time
 from urllib.parse import quote_plus
+try:
+    import orjson  # C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+REDDIT_RESULT_LIMIT = 10
+
+def dump_json(data, indent=True):
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+
+def load_json(raw):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def print_json(data):
+    """Write pretty-printed JSON to stdout as bytes"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(dump_json(data) + b'\n')
+    sys.stdout.buffer.flush()
 
 def analyze_instagram_hashtags(query):
     """Analyze Instagram hashtag popularity (simplified)"""
@@ -984,21 +1426,21 @@ def analyze_instagram_hashtags(query):
 
 def analyze_reddit_communities(query):
     """Analyze Reddit communities for topic interest"""
-    search_url = f"https://www.reddit.com/search.json?q={quote_plus(query)}&type=sr"
+    # Only the top subreddits are used, so ask Reddit not to send the rest
+    search_url = f"https://www.reddit.com/search.json?q={quote_plus(query)}&type=sr&limit={REDDIT_RESULT_LIMIT}"
     
     headers = {
         'User-Agent': 'BookResearch/1.0'
     }
     
     try:
-        time.sleep(2)  # Rate limiting
         response = requests.get(search_url, headers=headers, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = load_json(response.content)
             subreddits = []
             
-            for item in data.get('data', {}).get('children', [])[:10]:
+            for item in data.get('data', {}).get('children', [])[:REDDIT_RESULT_LIMIT]:
                 sub_data = item.get('data', {})
                 subreddits.append({
                     'name': sub_data.get('display_name', ''),
@@ -1041,14 +1483,15 @@ def analyze_pinterest_interest(query):
 
 def get_social_research_checklist(query):
     """Generate comprehensive social media research checklist"""
+    tag = query.replace(' ', '')
     return {
         'query': query,
         'platforms': {
             'tiktok': {
                 'hashtags_to_check': [
-                    f"#{query.replace(' ', '')}",
-                    f"#{query.replace(' ', '')}tips", 
-                    f"#{query.replace(' ', '')}hack"
+                    f"#{tag}",
+                    f"#{tag}tips", 
+                    f"#{tag}hack"
                 ],
                 'metrics_to_note': [
                     "Total hashtag views",
@@ -1059,7 +1502,7 @@ def get_social_research_checklist(query):
             },
             'instagram': {
                 'research_areas': [
-                    f"#{query.replace(' ', '')} hashtag page",
+                    f"#{tag} hashtag page",
                     f"Stories mentioning {query}",
                     f"Reels with {query} audio/hashtags",
                     f"Business accounts in niche"
@@ -1112,12 +1555,19 @@ if __name__ == "__main__":
         'research_checklist': get_social_research_checklist(query)
     }
     
-    print(json.dumps(analysis, indent=2))
+    print_json(analysis)
 EOF
 
     chmod +x "$DATA_DIR/social_analyzer.py"
 }
 
+# Run the report generator with lean interpreter flags: -OO drops docstrings
+# and asserts, PYTHONNODEBUGRANGES skips per-instruction column tables (3.11+).
+# -S is not used because it would hide site-packages (requests, orjson).
+run_report() {
+    PYTHONNODEBUGRANGES=1 python3 -OO "$DATA_DIR/report_generator.py" "$@"
+}
+
 # Enhanced search function with comprehensive analysis
 comprehensive_search() {
     local query="$1"
@@ -1141,11 +1591,12 @@ comprehensive_search() {
     
     # Step 4: Generate Comprehensive Report
     echo -e "${CYAN}Step 4: Generating Comprehensive Report${NC}"
-    python3 "$DATA_DIR/report_generator.py" "market_analysis.json" "trends_analysis.json"
+    run_report "market_analysis.json" "trends_analysis.json"
     
     echo -e "${GREEN}✅ Comprehensive analysis complete!${NC}"
     echo -e "${BLUE}📋 Files generated:${NC}"
     echo "  • market_results.json - Raw book data"
+    echo "  • market.db - Book store for all searches (by query and ASIN)"
     echo "  • market_analysis.json - Detailed analysis"
     echo "  • trends_analysis.json - Trend data"  
     echo "  • social_analysis.json - Social media research guide"
@@ -1580,9 +2031,11 @@ OPPORTUNITY SCORING CRITERIA:
 
 DEPENDENCIES:
     python3, requests, beautifulsoup4, curl
+    Optional (faster): lxml, orjson, brotli
 
 SETUP:
     pip3 install requests beautifulsoup4
+    pip3 install lxml orjson brotli    # optional
 
 For detailed configuration: $0 config
 For system status: $0 status
@@ -1715,7 +2168,7 @@ main() {
             ;;
         "report")
             create_research_suite
-            python3 "$DATA_DIR/report_generator.py" "market_analysis.json" "trends_analysis.json"
+            run_report "market_analysis.json" "trends_analysis.json"
             ;;
         "score")
             load_config